@@ -0,0 +1,29 @@
+"""Content-hashing helpers shared by the LLM clients."""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+
+
+_BLAKE3_AVAILABLE = importlib.util.find_spec("blake3") is not None
+if _BLAKE3_AVAILABLE:  # pragma: no cover - depends on optional dependency
+    from blake3 import blake3  # type: ignore
+else:  # pragma: no cover - fallback path executed when dependency missing
+    blake3 = None  # type: ignore
+
+
+def content_digest(data: bytes) -> str:
+    """Return a short hex digest for content-addressed cache keys.
+
+    Prefers BLAKE3 (SIMD-accelerated) when the optional ``blake3`` package
+    is installed, falling back to hashlib's keyed-capable BLAKE2b. Digests
+    are only compared within one process, so the two backends never mix.
+    """
+
+    if blake3 is not None:
+        return blake3(data).hexdigest()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+__all__ = ["content_digest"]
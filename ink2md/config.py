@@ -2,11 +2,46 @@
 
 from __future__ import annotations
 
+import importlib.util
 import json
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Literal, Optional, Sequence, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from typing import Literal
+
+
+_ORJSON_AVAILABLE = importlib.util.find_spec("orjson") is not None
+if _ORJSON_AVAILABLE:  # pragma: no cover - depends on optional dependency
+    import orjson  # type: ignore
+else:  # pragma: no cover - fallback path executed when dependency missing
+    orjson = None  # type: ignore
+
+
+@lru_cache(maxsize=256)
+def _resolve_absolute(text: str) -> Path:
+    """Resolve an already-absolute path string, memoizing the syscalls.
+
+    ``Path.resolve`` stats every component, which adds up when the same
+    config keys are coerced repeatedly (for example when ``load_config``
+    runs inside the poll loop). Only absolute paths are cached because
+    relative ones depend on the current working directory. Set
+    ``INK2MD_DISABLE_PATH_CACHE=1`` to bypass the cache entirely.
+    """
+
+    return Path(text).resolve()
+
+
+_PATH_CACHE_DISABLED = bool(os.environ.get("INK2MD_DISABLE_PATH_CACHE"))
+
+# Membership sets used by from_dict, built once instead of per call.
+_PIPELINES = frozenset(("markdown", "mindmap", "agentic"))
+_RELATIVE_OUTPUT_PROVIDERS = frozenset(("git", "obsidian"))
+_MEDIA_MODES = frozenset(("pdf", "png", "jpg"))
+_IMAGE_MEDIA_MODES = frozenset(("png", "jpg"))
 
 
 @dataclass(slots=True)
@@ -41,6 +76,8 @@ class LLMConfig:
     api_key: Optional[str] = None
     prompt_path: Optional[Path] = None
     temperature: float = 0.0
+    prefer_inline_payloads: bool = True
+    reuse_uploads: bool = False
 
 
 @dataclass(slots=True)
@@ -148,6 +185,8 @@ class AppConfig:
         path = Path(value).expanduser()
         if allow_relative and not path.is_absolute():
             return path
+        if path.is_absolute() and not _PATH_CACHE_DISABLED:
+            return _resolve_absolute(str(path))
         return path.resolve()
 
     @staticmethod
@@ -156,89 +195,90 @@ class AppConfig:
             return None
         if isinstance(value, Path):
             return value
-        return os.path.expandvars(str(value))
+        text = str(value)
+        # expandvars scans character by character in pure Python; skip it for
+        # the common literal case with no substitutions.
+        return os.path.expandvars(text) if "$" in text else text
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AppConfig":
+        coerce_path = cls._coerce_path
         provider = data.get("provider", "google_drive")
-        poll_interval = float(data.get("poll_interval", 300))
+        poll_interval = data.get("poll_interval", 300)
+        if not isinstance(poll_interval, float):
+            poll_interval = float(poll_interval)
         pipeline = str(data.get("pipeline", "markdown")).lower()
-        if pipeline not in {"markdown", "mindmap", "agentic"}:
+        if pipeline not in _PIPELINES:
             raise ValueError("pipeline must be either 'markdown', 'mindmap', or 'agentic'")
 
         markdown_data = data.get("markdown", {})
         output_provider = markdown_data.get("provider", "filesystem")
-        allow_relative = output_provider in {"git", "obsidian"}
-        output_dir = cls._coerce_path(
+        allow_relative = output_provider in _RELATIVE_OUTPUT_PROVIDERS
+        output_dir = coerce_path(
             markdown_data.get("directory"), allow_relative=allow_relative
         )
         if output_dir is None:
             raise ValueError("markdown.directory must be provided in the configuration")
         asset_value = markdown_data.get("asset_directory")
-        asset_dir = cls._coerce_path(
+        asset_dir = coerce_path(
             asset_value, allow_relative=allow_relative
         )
-        markdown_prompt = cls._coerce_path(markdown_data.get("prompt_path"))
+        markdown_prompt = coerce_path(markdown_data.get("prompt_path"))
 
         git_cfg = None
         if "git" in markdown_data and markdown_data["git"] is not None:
-            git_data = markdown_data["git"]
-            repository_path = cls._coerce_path(git_data.get("repository_path"))
+            git_get = markdown_data["git"].get
+            repository_path = coerce_path(git_get("repository_path"))
             if repository_path is None:
                 raise ValueError("markdown.git.repository_path is required when configuring git output")
             git_cfg = GitOutputConfig(
                 repository_path=repository_path,
-                branch=git_data.get("branch", "main"),
-                remote=git_data.get("remote", "origin"),
-                commit_message_template=git_data.get(
+                branch=git_get("branch", "main"),
+                remote=git_get("remote", "origin"),
+                commit_message_template=git_get(
                     "commit_message_template", "Add {document_name}"
                 ),
-                push=bool(git_data.get("push", False)),
+                push=bool(git_get("push", False)),
             )
 
         obsidian_cfg = None
         if output_provider == "obsidian":
-            obsidian_data = markdown_data.get("obsidian", {})
-            repository_path = cls._coerce_path(
-                obsidian_data.get("repository_path")
-            )
+            # Bind the lookup once; this block probes the same dict ~10 times.
+            obsidian_get = markdown_data.get("obsidian", {}).get
+            repository_path = coerce_path(obsidian_get("repository_path"))
             if repository_path is None:
                 raise ValueError(
                     "markdown.obsidian.repository_path is required when configuring Obsidian output"
                 )
-            repository_url = obsidian_data.get("repository_url")
+            repository_url = obsidian_get("repository_url")
             if not repository_url:
                 raise ValueError(
                     "markdown.obsidian.repository_url is required when configuring Obsidian output"
                 )
-            private_key_path = cls._coerce_path(
-                obsidian_data.get("private_key_path")
-            )
-            known_hosts_path = cls._coerce_path(
-                obsidian_data.get("known_hosts_path")
-            )
-            media_mode = obsidian_data.get("media_mode", "pdf").lower()
+            private_key_path = coerce_path(obsidian_get("private_key_path"))
+            known_hosts_path = coerce_path(obsidian_get("known_hosts_path"))
+            media_mode = obsidian_get("media_mode", "pdf").lower()
             if media_mode == "jpeg":
                 media_mode = "jpg"
-            if media_mode not in {"pdf", "png", "jpg"}:
+            if media_mode not in _MEDIA_MODES:
                 raise ValueError(
                     "markdown.obsidian.media_mode must be one of 'pdf', 'png', or 'jpg'"
                 )
-            media_invert = bool(obsidian_data.get("media_invert", False))
-            if media_invert and media_mode not in {"png", "jpg"}:
+            media_invert = bool(obsidian_get("media_invert", False))
+            if media_invert and media_mode not in _IMAGE_MEDIA_MODES:
                 raise ValueError(
                     "markdown.obsidian.media_invert is only supported when media_mode is 'png' or 'jpg'"
                 )
             obsidian_cfg = ObsidianOutputConfig(
                 repository_path=repository_path,
                 repository_url=str(repository_url),
-                branch=obsidian_data.get("branch", "main"),
-                remote=obsidian_data.get("remote", "origin"),
-                commit_message_template=obsidian_data.get(
+                branch=obsidian_get("branch", "main"),
+                remote=obsidian_get("remote", "origin"),
+                commit_message_template=obsidian_get(
                     "commit_message_template",
                     "A new file from you has been added: {markdown_path}",
                 ),
-                push=bool(obsidian_data.get("push", True)),
+                push=bool(obsidian_get("push", True)),
                 private_key_path=private_key_path,
                 known_hosts_path=known_hosts_path,
                 media_mode=media_mode,  # type: ignore[arg-type]
@@ -270,23 +310,28 @@ class AppConfig:
             google_drive=google_drive_output_cfg,
         )
 
-        state_path = cls._coerce_path(data["state"]["path"])
+        state_path = coerce_path(data["state"]["path"])
         state = StateConfig(path=state_path)
 
         llm_data = data.get("llm", {})
+        prefer_inline = bool(llm_data.get("prefer_inline_payloads", True))
         llm = LLMConfig(
             provider=llm_data.get("provider", "simple"),
             model=llm_data.get("model"),
             endpoint=llm_data.get("endpoint"),
             api_key=cls._expand_env(llm_data.get("api_key")),
-            prompt_path=cls._coerce_path(llm_data.get("prompt_path")),
+            prompt_path=coerce_path(llm_data.get("prompt_path")),
             temperature=float(llm_data.get("temperature", 0.0)),
+            prefer_inline_payloads=prefer_inline,
+            # Upload-mode clients dedupe identical PDFs by default; inline
+            # mode never uploads, so reuse is moot there.
+            reuse_uploads=bool(llm_data.get("reuse_uploads", not prefer_inline)),
         )
 
         mindmap_cfg = None
         if "mindmap" in data:
             mindmap_data = data["mindmap"] or {}
-            mm_prompt = cls._coerce_path(mindmap_data.get("prompt_path"))
+            mm_prompt = coerce_path(mindmap_data.get("prompt_path"))
             keep_local_copy = bool(mindmap_data.get("keep_local_copy", False))
 
             gd_output_cfg = None
@@ -307,7 +352,7 @@ class AppConfig:
         agentic_cfg = None
         if "agentic" in data:
             agentic_data = data["agentic"] or {}
-            ag_prompt = cls._coerce_path(agentic_data.get("prompt_path"))
+            ag_prompt = coerce_path(agentic_data.get("prompt_path"))
             hashtags = agentic_data.get("hashtags", ["mm", "mindmap"])
             hashtags_tuple = tuple(str(tag).lstrip("#").lower() for tag in hashtags)
             agentic_cfg = AgenticConfig(prompt_path=ag_prompt, hashtags=hashtags_tuple)
@@ -315,24 +360,25 @@ class AppConfig:
         google_drive_cfg = None
         if "google_drive" in data:
             gd = data["google_drive"]
+            gd_get = gd.get
 
-            oauth_client_secrets_file = cls._coerce_path(
-                gd.get("oauth_client_secrets_file")
+            oauth_client_secrets_file = coerce_path(
+                gd_get("oauth_client_secrets_file")
             )
             if oauth_client_secrets_file is None:
                 raise ValueError(
                     "google_drive.oauth_client_secrets_file is required for OAuth-based access"
                 )
 
-            token_override = gd.get("oauth_token_file")
+            token_override = gd_get("oauth_token_file")
             if token_override is not None:
-                oauth_token_file = cls._coerce_path(token_override)
+                oauth_token_file = coerce_path(token_override)
             else:
                 oauth_token_file = oauth_client_secrets_file.with_name(
                     f"{oauth_client_secrets_file.stem}_token.json"
                 )
 
-            scopes: Sequence[str] = gd.get(
+            scopes: Sequence[str] = gd_get(
                 "scopes", ["https://www.googleapis.com/auth/drive.readonly"]
             )
             scopes_tuple = tuple(str(scope) for scope in scopes)
@@ -341,13 +387,13 @@ class AppConfig:
                 folder_id=gd["folder_id"],
                 oauth_client_secrets_file=oauth_client_secrets_file,
                 oauth_token_file=oauth_token_file,
-                page_size=int(gd.get("page_size", 100)),
+                page_size=int(gd_get("page_size", 100)),
                 scopes=scopes_tuple,
             )
 
         local_cfg = None
         if "local" in data:
-            local_cfg = LocalFolderConfig(path=cls._coerce_path(data["local"]["path"]))
+            local_cfg = LocalFolderConfig(path=coerce_path(data["local"]["path"]))
 
         return cls(
             provider=provider,
@@ -363,17 +409,34 @@ class AppConfig:
         )
 
 
+# Parsed configs keyed by resolved path; the (mtime_ns, size) pair detects
+# edits so unchanged files skip JSON parsing and dataclass construction.
+_CONFIG_CACHE: Dict[Path, Tuple[Tuple[int, int], AppConfig]] = {}
+
+
 def load_config(path: str | Path) -> AppConfig:
     """Load configuration data from a JSON file."""
 
     config_path = Path(path).expanduser().resolve()
-    if not config_path.exists():
+    try:
+        stat = config_path.stat()
+    except OSError:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    with config_path.open("r", encoding="utf-8") as handle:
-        data = json.load(handle)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    raw = config_path.read_bytes()
+    if orjson is not None:
+        data = orjson.loads(raw)
+    else:
+        data = json.loads(raw)
 
-    return AppConfig.from_dict(data)
+    config = AppConfig.from_dict(data)
+    _CONFIG_CACHE[config_path] = (signature, config)
+    return config
 
 
 __all__ = [
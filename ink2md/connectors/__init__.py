@@ -1,8 +1,6 @@
 """Connector implementations for Ink2MD."""
 
 from .base import CloudConnector, CloudDocument
-from .google_drive import GoogleDriveConnector
-from .local import LocalFolderConnector
 
 __all__ = [
     "CloudConnector",
@@ -10,3 +8,25 @@ __all__ = [
     "GoogleDriveConnector",
     "LocalFolderConnector",
 ]
+
+# PEP 562 lazy re-exports: the Drive connector transitively imports the
+# Google API client stack, which local-folder pipelines should not pay for.
+_LAZY_EXPORTS = {
+    "GoogleDriveConnector": "google_drive",
+    "LocalFolderConnector": "local",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    attribute = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = attribute
+    return attribute
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -3,15 +3,53 @@
 from __future__ import annotations
 
 import io
+import random
+import threading
 import time
-from datetime import datetime
-from typing import Callable, Iterable, List, Optional, TypeVar
+from datetime import datetime, timezone
+from typing import Callable, Iterator, Optional, TypeVar
 
 from .base import CloudConnector, CloudDocument
 
 
 T = TypeVar("T")
 
+_UTC = timezone.utc
+
+# Fetch PDFs in one large chunk where possible; scanned notebooks are a few
+# megabytes at most, so this avoids per-chunk HTTP round trips.
+_DOWNLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+
+
+def _parse_drive_timestamp(value: str) -> datetime:
+    """Parse an RFC 3339 timestamp as returned by the Drive API.
+
+    Drive always emits ``YYYY-MM-DDTHH:MM:SS[.fff]Z``, so a slice-based
+    parse avoids the general ISO parser plus the two string allocations of
+    ``value.replace("Z", "+00:00")`` for every listed file. Anything that
+    does not match the expected shape falls back to ``fromisoformat``.
+    """
+
+    if value.endswith("Z"):
+        try:
+            microsecond = 0
+            if len(value) > 20 and value[19] == ".":
+                fraction = value[20:-1]
+                microsecond = int(fraction.ljust(6, "0")[:6])
+            return datetime(
+                int(value[0:4]),
+                int(value[5:7]),
+                int(value[8:10]),
+                int(value[11:13]),
+                int(value[14:16]),
+                int(value[17:19]),
+                microsecond,
+                tzinfo=_UTC,
+            )
+        except (ValueError, IndexError):
+            pass
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
 
 class GoogleDriveConnector(CloudConnector):
     """Interact with Google Drive to retrieve PDFs from a specific folder."""
@@ -30,16 +68,34 @@ class GoogleDriveConnector(CloudConnector):
         self._page_size = page_size
         self._max_retries = max(1, int(max_retries))
         self._retry_initial_backoff = max(0.1, float(retry_initial_backoff))
+        # file id -> (raw modifiedTime, document); lets successive polls
+        # skip timestamp parsing and allocation for unchanged files.
+        self._document_cache: dict[str, tuple[Optional[str], CloudDocument]] = {}
+        # Per-thread authorized transports for concurrent downloads; see
+        # _thread_http.
+        self._thread_local = threading.local()
+
+    def list_pdfs(self) -> Iterator[CloudDocument]:
+        """Yield PDFs page by page instead of buffering the whole folder.
+
+        Streaming keeps peak memory at O(page_size) and lets callers begin
+        downloading documents from the first page while later pages are
+        still being fetched.
+        """
 
-    def list_pdfs(self) -> Iterable[CloudDocument]:
         query = (
             f"'{self._folder_id}' in parents and mimeType='application/pdf' "
             "and trashed = false"
         )
         fields = "nextPageToken, files(id, name, modifiedTime, webViewLink)"
-        page_token: Optional[str] = None
-        documents: List[CloudDocument] = []
-        while True:
+        page_token: Optional[str] = None
+        # Hoist per-item global lookups out of the decode loop; for large
+        # folders these add up across thousands of records.
+        parse_timestamp = _parse_drive_timestamp
+        make_document = CloudDocument
+        cache = self._document_cache
+        fresh_cache: dict[str, tuple[Optional[str], CloudDocument]] = {}
+        while True:
             response = self._with_retry(
                 lambda page_token=page_token: self._service.files()
                 .list(
@@ -52,39 +108,86 @@ class GoogleDriveConnector(CloudConnector):
                 )
                 .execute()
             )
-            for item in response.get("files", []):
-                modified_at = None
-                if "modifiedTime" in item:
-                    modified_at = datetime.fromisoformat(
-                        item["modifiedTime"].replace("Z", "+00:00")
-                    )
-                documents.append(
-                    CloudDocument(
-                        identifier=item["id"],
-                        name=item.get("name", item["id"]),
-                        modified_at=modified_at,
-                        download_url=item.get("webViewLink"),
-                    )
-                )
-            page_token = response.get("nextPageToken")
-            if not page_token:
-                break
-        return documents
-
+            for item in response.get("files", ()):
+                identifier = item["id"]
+                raw_modified = item.get("modifiedTime")
+                cached = cache.get(identifier)
+                if cached is not None and cached[0] == raw_modified:
+                    document = cached[1]
+                else:
+                    document = make_document(
+                        identifier=identifier,
+                        name=item.get("name", identifier),
+                        modified_at=(
+                            parse_timestamp(raw_modified)
+                            if raw_modified is not None
+                            else None
+                        ),
+                        download_url=item.get("webViewLink"),
+                    )
+                fresh_cache[identifier] = (raw_modified, document)
+                yield document
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
+        # Swap in the rebuilt cache so entries for deleted files do not
+        # accumulate across polls.
+        self._document_cache = fresh_cache
+
     def download_pdf(self, document: CloudDocument) -> bytes:
+        # Deliberately function-local rather than module-scope: after the
+        # first resolution this is a cached sys.modules lookup, it keeps
+        # googleapiclient optional at import time, and it lets tests inject
+        # a fake http module. Importing here (not inside the retry closure)
+        # still performs the lookup once per download instead of once per
+        # attempt.
+        from googleapiclient.http import MediaIoBaseDownload  # type: ignore
+
         def _download() -> bytes:
             request = self._service.files().get_media(fileId=document.identifier)
+            # httplib2 connections are not thread-safe; the processor keeps
+            # several downloads in flight, so each worker thread swaps in its
+            # own authorized transport instead of sharing the service's.
+            http = self._thread_http()
+            if http is not None:
+                request.http = http
             buffer = io.BytesIO()
-            from googleapiclient.http import MediaIoBaseDownload  # type: ignore
-
-            downloader = MediaIoBaseDownload(buffer, request)
+            downloader = MediaIoBaseDownload(
+                buffer, request, chunksize=_DOWNLOAD_CHUNK_SIZE
+            )
             done = False
             while not done:
                 _status, done = downloader.next_chunk()
-            return buffer.getvalue()
+            # Snapshot through the buffer view; with the 16 MiB chunk size
+            # most PDFs arrive in one write, so this is the only copy made.
+            return buffer.getbuffer().tobytes()
 
         return self._with_retry(_download)
 
+    def _thread_http(self):
+        """Return this thread's authorized http transport, building it once.
+
+        Falls back to ``None`` (share the service's transport) when the
+        service exposes no credentials — e.g. the fake services used in
+        tests — in which case callers must serialise their downloads.
+        """
+
+        http = getattr(self._thread_local, "http", None)
+        if http is None:
+            credentials = getattr(
+                getattr(self._service, "_http", None), "credentials", None
+            )
+            if credentials is None:
+                return None
+            import google_auth_httplib2  # type: ignore
+            import httplib2  # type: ignore
+
+            http = google_auth_httplib2.AuthorizedHttp(
+                credentials, http=httplib2.Http()
+            )
+            self._thread_local.http = http
+        return http
+
     def _with_retry(self, operation: Callable[[], T]) -> T:
         delay = self._retry_initial_backoff
         last_error: Optional[Exception] = None
@@ -95,7 +198,9 @@ class GoogleDriveConnector(CloudConnector):
                 if not self._is_retryable_error(exc) or attempt == self._max_retries - 1:
                     raise
                 last_error = exc
-                self._sleep(delay)
+                # Full jitter keeps concurrent clients from retrying in
+                # lockstep after a shared 429/5xx burst.
+                self._sleep(random.uniform(0, delay))
                 delay = min(delay * 2, 30.0)
         if last_error is not None:  # pragma: no cover - defensive
             raise last_error
@@ -111,11 +216,11 @@ class GoogleDriveConnector(CloudConnector):
             status_code = int(status)
         except (TypeError, ValueError):
             return False
-        return 500 <= status_code < 600
+        return status_code == 429 or 500 <= status_code < 600
 
     @staticmethod
     def _sleep(seconds: float) -> None:
         time.sleep(seconds)
-
-
-__all__ = ["GoogleDriveConnector"]
+
+
+__all__ = ["GoogleDriveConnector"]
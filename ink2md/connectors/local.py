@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import mmap
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterator
 
 from .base import CloudConnector, CloudDocument
 
+# Files at or above this size are memory-mapped instead of read through
+# buffered I/O, letting the kernel page data in without a userspace copy.
+_MMAP_THRESHOLD = 8 * 1024 * 1024
+
 
 class LocalFolderConnector(CloudConnector):
     """Treat a folder on the local filesystem as the monitored source."""
@@ -17,25 +23,35 @@ class LocalFolderConnector(CloudConnector):
         if not self._folder.exists():
             raise FileNotFoundError(f"Local folder does not exist: {self._folder}")
 
-    def list_pdfs(self) -> Iterable[CloudDocument]:  # pragma: no cover - simple wrapper
-        documents: List[CloudDocument] = []
-        for path in sorted(self._folder.glob("*.pdf")):
-            stat = path.stat()
-            documents.append(
-                CloudDocument(
-                    identifier=str(path),
-                    name=path.stem,
-                    modified_at=datetime.fromtimestamp(stat.st_mtime),
-                    download_url=str(path),
-                )
+    def list_pdfs(self) -> Iterator[CloudDocument]:  # pragma: no cover - simple wrapper
+        # os.scandir surfaces the cached stat result from the directory
+        # read itself, avoiding a separate stat() syscall per file.
+        with os.scandir(self._folder) as entries:
+            matches = [
+                entry
+                for entry in entries
+                if entry.name.endswith(".pdf") and entry.is_file()
+            ]
+        matches.sort(key=lambda entry: entry.name)
+        for entry in matches:
+            identifier = str(self._folder / entry.name)
+            yield CloudDocument(
+                identifier=identifier,
+                name=entry.name[: -len(".pdf")],
+                modified_at=datetime.fromtimestamp(entry.stat().st_mtime),
+                download_url=identifier,
             )
-        return documents
 
     def download_pdf(self, document: CloudDocument) -> bytes:
         pdf_path = Path(document.identifier)
-        if not pdf_path.exists():
-            raise FileNotFoundError(f"PDF not found: {pdf_path}")
+        try:
+            size = pdf_path.stat().st_size
+        except OSError:
+            raise FileNotFoundError(f"PDF not found: {pdf_path}") from None
         with pdf_path.open("rb") as handle:
+            if size >= _MMAP_THRESHOLD:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return bytes(mapped)
             return handle.read()
 
 
@@ -2,23 +2,38 @@
 
 from __future__ import annotations
 
-import importlib.util
 import logging
 import os
+import re
 import tempfile
-from dataclasses import dataclass
-from typing import List, Optional
+import threading
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
 
+from .._hashing import content_digest as _content_digest
 from ..connectors.base import CloudDocument
 from ..mindmap import Mindmap, MindmapValidationError
 from .base import LLMClient
 
 
-_GENAI_SPEC = importlib.util.find_spec("google.generativeai")
-if _GENAI_SPEC:  # pragma: no cover - imported dynamically in tests
-    import google.generativeai as genai  # type: ignore
-else:  # pragma: no cover - fallback executed when dependency missing
-    genai = None  # type: ignore
+# Resolved lazily by _get_genai(); importing google.generativeai pulls in
+# gRPC and protobuf, which users of the simple backend should never pay for.
+genai = None  # type: ignore
+
+
+def _get_genai():
+    """Import and cache the google.generativeai module on first use."""
+
+    global genai
+    if genai is None:
+        try:
+            import google.generativeai as _genai  # type: ignore
+        except ImportError as exc:  # pragma: no cover - depends on environment
+            raise RuntimeError(
+                "GeminiLLMClient requires the 'google-generativeai' package."
+            ) from exc
+        genai = _genai
+    return genai
 
 DEFAULT_GEMINI_PROMPT = (
     "You are a senior technical writer who converts PDF documents into clean Markdown. "
@@ -41,6 +56,18 @@ DEFAULT_GEMINI_ORCHESTRATION_PROMPT = (
 )
 LOGGER = logging.getLogger(__name__)
 
+# genai.configure mutates global SDK state, so remember the last key applied
+# and reuse GenerativeModel instances across clients with identical settings.
+_CONFIGURED_API_KEY: Optional[str] = None
+_MODEL_CACHE: dict = {}
+
+# Per-client cap on remembered conversions; entries are evicted oldest-first.
+_RESPONSE_CACHE_MAX = 16
+
+# Per-client cap on reused Gemini file uploads. Evicted handles are not
+# deleted remotely; Gemini expires uploads on its own schedule.
+_UPLOAD_CACHE_MAX = 8
+
 
 @dataclass(slots=True)
 class GeminiLLMClient(LLMClient):
@@ -51,26 +78,47 @@ class GeminiLLMClient(LLMClient):
     prompt: Optional[str] = None
     temperature: float = 0.0
     prefer_inline_payloads: bool = True
+    reuse_uploads: bool = False
+    classification_hashtags: Tuple[str, ...] = ("mm", "mindmap")
+    _upload_cache: dict = field(default_factory=dict, init=False, repr=False)
+    _hashtag_markers: Tuple[str, ...] = field(default=(), init=False, repr=False)
+    _last_inline: Optional[tuple] = field(default=None, init=False, repr=False)
+    _response_cache: dict = field(default_factory=dict, init=False, repr=False)
+    # convert_pdf runs on the processor's worker threads; the caches need a
+    # lock so concurrent evictions cannot race on the same oldest key.
+    _cache_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
 
     def __post_init__(self) -> None:
-        if genai is None:  # pragma: no cover - depends on optional dependency
-            raise RuntimeError(
-                "GeminiLLMClient requires the 'google-generativeai' package."
-            )
+        genai = _get_genai()
         if not self.api_key:
             raise ValueError("GeminiLLMClient requires a non-empty API key.")
         if not self.model:
             raise ValueError("GeminiLLMClient requires the name of a Gemini model.")
-
-        genai.configure(api_key=self.api_key)
-        generation_config = {
-            "temperature": float(self.temperature),
-        }
-        self._model = genai.GenerativeModel(
-            model_name=self.model,
-            generation_config=generation_config,
+        if self.prompt is not None:
+            # Normalise once at construction; the per-request paths reuse the
+            # prepared text instead of re-stripping it for every document.
+            self.prompt = self.prompt.strip() or None
+        self._hashtag_markers = tuple(
+            "#" + tag.lstrip("#").lower() for tag in self.classification_hashtags
         )
 
+        global _CONFIGURED_API_KEY
+        if _CONFIGURED_API_KEY != self.api_key:
+            genai.configure(api_key=self.api_key)
+            _CONFIGURED_API_KEY = self.api_key
+
+        cache_key = (self.model, float(self.temperature))
+        model = _MODEL_CACHE.get(cache_key)
+        if model is None:
+            model = genai.GenerativeModel(
+                model_name=self.model,
+                generation_config={"temperature": float(self.temperature)},
+            )
+            _MODEL_CACHE[cache_key] = model
+        self._model = model
+
     def convert_pdf(
         self,
         document: CloudDocument,
@@ -78,7 +126,15 @@ class GeminiLLMClient(LLMClient):
         prompt: str | None = None,
     ) -> str:
         """Upload the PDF to Gemini and return a consolidated Markdown summary."""
-        instructions = (prompt or self.prompt or DEFAULT_GEMINI_PROMPT).strip()
+        instructions = prompt.strip() if prompt else (self.prompt or DEFAULT_GEMINI_PROMPT)
+        # Identical bytes with identical instructions always produce the same
+        # request (model and temperature are fixed per client), so repeats can
+        # skip the upload and generation round-trip entirely.
+        cache_key = (instructions, _content_digest(pdf_bytes))
+        with self._cache_lock:
+            cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            return cached
         file_handle = self._prepare_file_handle(document, pdf_bytes)
         try:
             payload = [{"text": instructions}, file_handle.as_part]
@@ -86,7 +142,8 @@ class GeminiLLMClient(LLMClient):
         except Exception as exc:  # pragma: no cover - dependent on external library
             raise RuntimeError("Gemini API request failed") from exc
         finally:
-            file_handle.cleanup()
+            if not file_handle._IS_INLINE:
+                file_handle.cleanup()
         
         feedback = getattr(response, "prompt_feedback", None)
         if feedback and getattr(feedback, "block_reason", None):
@@ -96,6 +153,10 @@ class GeminiLLMClient(LLMClient):
         markdown = self._extract_response_text(response)
         if not markdown:
             raise RuntimeError("Gemini did not return any text content.")
+        with self._cache_lock:
+            if len(self._response_cache) >= _RESPONSE_CACHE_MAX:
+                self._response_cache.pop(next(iter(self._response_cache)), None)
+            self._response_cache[cache_key] = markdown
         return markdown
 
     def extract_mindmap(
@@ -104,7 +165,7 @@ class GeminiLLMClient(LLMClient):
         pdf_bytes: bytes,
         prompt: str | None = None,
     ) -> Mindmap:
-        instructions = (prompt or self.prompt or DEFAULT_GEMINI_MINDMAP_PROMPT).strip()
+        instructions = prompt.strip() if prompt else (self.prompt or DEFAULT_GEMINI_MINDMAP_PROMPT)
         file_handle = self._prepare_file_handle(document, pdf_bytes)
         try:
             payload = [{"text": instructions}, file_handle.as_part]
@@ -112,7 +173,8 @@ class GeminiLLMClient(LLMClient):
         except Exception as exc:  # pragma: no cover - dependent on external library
             raise RuntimeError("Gemini API request failed") from exc
         finally:
-            file_handle.cleanup()
+            if not file_handle._IS_INLINE:
+                file_handle.cleanup()
 
         feedback = getattr(response, "prompt_feedback", None)
         if feedback and getattr(feedback, "block_reason", None):
@@ -135,10 +197,13 @@ class GeminiLLMClient(LLMClient):
         pdf_bytes: bytes,
         prompt: str | None = None,
     ) -> str:
-        instructions = (prompt or self.prompt or DEFAULT_GEMINI_ORCHESTRATION_PROMPT).strip()
+        # Check the filename for routing hashtags before building a prompt or
+        # payload; a match avoids the Gemini round-trip entirely.
         name = (document.name or "").lower()
-        if "#mm" in name or "#mindmap" in name:
-            return "mindmap"
+        for marker in self._hashtag_markers:
+            if marker in name:
+                return "mindmap"
+        instructions = prompt.strip() if prompt else (self.prompt or DEFAULT_GEMINI_ORCHESTRATION_PROMPT)
         file_handle = self._prepare_file_handle(document, pdf_bytes)
         try:
             payload = [{"text": instructions}, file_handle.as_part]
@@ -146,14 +211,17 @@ class GeminiLLMClient(LLMClient):
         except Exception as exc:  # pragma: no cover
             raise RuntimeError("Gemini API request failed") from exc
         finally:
-            file_handle.cleanup()
+            if not file_handle._IS_INLINE:
+                file_handle.cleanup()
 
         feedback = getattr(response, "prompt_feedback", None)
         if feedback and getattr(feedback, "block_reason", None):
             reason = getattr(feedback, "block_reason", "unspecified")
             raise RuntimeError(f"Gemini blocked the request: {reason}")
 
-        decision = _unwrap_code_fences(self._extract_response_text(response)).strip().lower()
+        # Only the leading word matters for routing; cap the slice that gets
+        # lowercased and scanned instead of processing the whole response.
+        decision = _unwrap_code_fences(self._extract_response_text(response))[:64].lower()
         if "mindmap" in decision:
             return "mindmap"
         return "markdown"
@@ -163,18 +231,53 @@ class GeminiLLMClient(LLMClient):
     ) -> "_InlineFileHandle | _UploadedFileHandle":
         """Return the preferred payload handle for Gemini requests."""
         if self.prefer_inline_payloads:
-            return _InlineFileHandle(pdf_bytes=pdf_bytes)
+            # The agentic pipeline classifies and then converts the same
+            # bytes object back to back; hand out the same part dict instead
+            # of rebuilding it. Identity comparison keeps the hit test O(1).
+            last = self._last_inline
+            if last is not None and last[0] is pdf_bytes:
+                return last[1]
+            handle = _InlineFileHandle(pdf_bytes=pdf_bytes)
+            self._last_inline = (pdf_bytes, handle)
+            return handle
+        if self.reuse_uploads:
+            digest = _content_digest(pdf_bytes)
+            with self._cache_lock:
+                cached = self._upload_cache.get(digest)
+            if cached is not None:
+                return cached
+            # The upload itself runs outside the lock; two threads racing on
+            # the same digest upload twice and the later handle wins, which
+            # is wasteful but harmless.
+            handle = self._upload_pdf(document, pdf_bytes)
+            if isinstance(handle, _UploadedFileHandle):
+                handle = _SharedUploadHandle(handle._file)
+                with self._cache_lock:
+                    if len(self._upload_cache) >= _UPLOAD_CACHE_MAX:
+                        self._upload_cache.pop(next(iter(self._upload_cache)), None)
+                    self._upload_cache[digest] = handle
+            return handle
         return self._upload_pdf(document, pdf_bytes)
 
     def _upload_pdf(self, document: CloudDocument, pdf_bytes: bytes):
-        """Persist the PDF to a temp file and upload it to Gemini's file store."""
-        if genai is None:  # pragma: no cover - safety check
-            raise RuntimeError("Gemini client is not configured.")
+        """Upload the PDF to Gemini's file store, staging a temp file if needed.
+
+        Documents sourced from the local connector already live on disk, so
+        their existing file is uploaded directly instead of writing the same
+        bytes to a temporary copy first.
+        """
+        genai = _get_genai()
 
         display_name = (document.name or "document").strip() or "document"
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-            tmp.write(pdf_bytes)
-            tmp_path = tmp.name
+        source_path = self._local_source_path(document)
+        if source_path is not None:
+            tmp_path = source_path
+            cleanup_tmp = False
+        else:
+            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+                tmp.write(pdf_bytes)
+                tmp_path = tmp.name
+            cleanup_tmp = True
 
         try:
             file = genai.upload_file(
@@ -191,35 +294,57 @@ class GeminiLLMClient(LLMClient):
             )
             return _InlineFileHandle(pdf_bytes=pdf_bytes)
         finally:
-            try:
-                os.unlink(tmp_path)
-            except OSError:
-                pass
+            if cleanup_tmp:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
 
         return _UploadedFileHandle(file)
 
+    @staticmethod
+    def _local_source_path(document: CloudDocument) -> str | None:
+        """Return the document's on-disk path when it already exists locally."""
+        candidate = document.download_url or ""
+        if candidate.lower().endswith(".pdf") and os.path.isfile(candidate):
+            return candidate
+        return None
+
     @staticmethod
     def _extract_response_text(response) -> str:
-        text = getattr(response, "text", "") or ""
+        # Fast path: responses with aggregated text are the overwhelmingly
+        # common case, so read the attribute directly rather than paying for
+        # a chain of defensive getattr calls on every request.
+        try:
+            text = response.text
+        except AttributeError:
+            text = None
         if text:
             return text.strip()
 
         candidates = getattr(response, "candidates", None)
+        if not candidates:
+            return ""
         parts: List[str] = []
-        if candidates:
-            for candidate in candidates:
-                content = getattr(candidate, "content", None)
-                if not content:
-                    continue
-                for part in getattr(content, "parts", []):
-                    value = getattr(part, "text", None)
-                    if value:
-                        parts.append(str(value))
+        for candidate in candidates:
+            content = getattr(candidate, "content", None)
+            if not content:
+                continue
+            for part in getattr(content, "parts", []):
+                value = getattr(part, "text", None)
+                if value:
+                    parts.append(str(value))
         return "\n".join(parts).strip()
 
 class _UploadedFileHandle:
     """Lightweight wrapper to ensure uploaded files are cleaned up."""
 
+    __slots__ = ("_file",)
+
+    # Request paths skip the cleanup() dispatch entirely for inline handles,
+    # which dominate with prefer_inline_payloads=True.
+    _IS_INLINE = False
+
     def __init__(self, file_obj) -> None:
         self._file = file_obj
 
@@ -244,9 +369,26 @@ class _UploadedFileHandle:
             pass
 
 
+class _SharedUploadHandle(_UploadedFileHandle):
+    """Uploaded-file handle kept alive for reuse across requests.
+
+    cleanup() is a no-op so identical PDFs can be answered from the same
+    Gemini file upload; the remote file expires on Gemini's own schedule.
+    """
+
+    __slots__ = ()
+
+    def cleanup(self) -> None:
+        return None
+
+
 class _InlineFileHandle:
     """Inline payload wrapper used when Gemini uploads are unavailable."""
 
+    __slots__ = ("_part",)
+
+    _IS_INLINE = True
+
     def __init__(self, *, pdf_bytes: bytes) -> None:
         self._part = {
             "inline_data": {
@@ -263,13 +405,18 @@ class _InlineFileHandle:
         return None
 
 
+# Matches a whole response wrapped in a single code fence, capturing the body.
+_FENCE_PATTERN = re.compile(r"\A```[^\n]*\n(.*)\n```[^\n]*\Z", re.DOTALL)
+
+
 def _unwrap_code_fences(value: str) -> str:
+    if "```" not in value:
+        # Common case: no fence anywhere, so skip the strip+match machinery.
+        return value.strip()
     trimmed = value.strip()
-    if not trimmed.startswith("```"):
-        return trimmed
-    lines = trimmed.splitlines()
-    if len(lines) >= 2 and lines[0].startswith("```") and lines[-1].startswith("```"):
-        return "\n".join(lines[1:-1]).strip()
+    match = _FENCE_PATTERN.match(trimmed)
+    if match:
+        return match.group(1).strip()
     return trimmed
 
 
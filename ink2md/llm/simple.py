@@ -4,13 +4,24 @@ from __future__ import annotations
 
 import importlib.util
 import io
-from dataclasses import dataclass
-from typing import Optional
-
-from ..connectors.base import CloudDocument
-from ..mindmap import Mindmap, MindmapNode
-from .base import LLMClient
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Optional
 
+from .._hashing import content_digest as _content_digest
+from ..connectors.base import CloudDocument
+from ..mindmap import Mindmap, MindmapNode
+from .base import LLMClient
+
+
+# Prefer pdfium (C++-backed, already a project dependency for rendering)
+# for text extraction; pure-Python pypdf remains the fallback.
+_PDFIUM_AVAILABLE = importlib.util.find_spec("pypdfium2") is not None
+if _PDFIUM_AVAILABLE:  # pragma: no cover - depends on optional dependency
+    import pypdfium2 as pdfium  # type: ignore
+else:  # pragma: no cover - fallback path executed when dependency missing
+    pdfium = None  # type: ignore
 
 _PYPDF_AVAILABLE = importlib.util.find_spec("pypdf") is not None
 if _PYPDF_AVAILABLE:  # pragma: no cover - depends on optional dependency
@@ -21,12 +32,24 @@ else:  # pragma: no cover - fallback path executed when dependency missing
 
 DEFAULT_PROMPT = """You are a helpful assistant that converts PDF content to Markdown."""
 
+# Paragraph boundaries: a newline followed by blank (or whitespace-only) lines.
+_PARAGRAPH_SPLIT = re.compile(r"\n\s*\n")
+
+# Extracted text kept per PDF digest; evicted oldest-first at this cap.
+_TEXT_CACHE_MAX = 8
+
 
 @dataclass(slots=True)
 class SimpleLLMClient(LLMClient):
     """Convert PDFs to Markdown using local text extraction heuristics."""
 
     prompt: Optional[str] = None
+    _text_cache: dict = field(default_factory=dict, init=False, repr=False)
+    # convert_pdf runs on the processor's worker threads; eviction must not
+    # race on the same oldest key.
+    _cache_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
 
     def convert_pdf(self, document: CloudDocument, pdf_bytes: bytes, prompt: str | None = None) -> str:
         effective_prompt = prompt or self.prompt or DEFAULT_PROMPT
@@ -37,59 +60,86 @@ class SimpleLLMClient(LLMClient):
             markdown_lines.append("")
         return "\n".join(markdown_lines).strip()
 
-    def _extract_text(self, pdf_bytes: bytes) -> str:
-        if PdfReader is None:
-            return "(Install 'pypdf' to enable local PDF text extraction.)"
-        reader = PdfReader(io.BytesIO(pdf_bytes))
-        contents = []
-        for page in reader.pages:
-            page_text = page.extract_text() or ""
-            contents.append(page_text.strip())
-        return "\n".join(contents)
+    def _extract_text(self, pdf_bytes: bytes) -> str:
+        # The agentic pipeline parses the same bytes for classification and
+        # again for conversion; remember recent extractions by content digest.
+        key = _content_digest(pdf_bytes)
+        with self._cache_lock:
+            cached = self._text_cache.get(key)
+        if cached is not None:
+            return cached
+        text = self._extract_text_uncached(pdf_bytes)
+        with self._cache_lock:
+            if len(self._text_cache) >= _TEXT_CACHE_MAX:
+                self._text_cache.pop(next(iter(self._text_cache)), None)
+            self._text_cache[key] = text
+        return text
+
+    def _extract_text_uncached(self, pdf_bytes: bytes) -> str:
+        if pdfium is not None:
+            return self._extract_text_pdfium(pdf_bytes)
+        if PdfReader is None:
+            return "(Install 'pypdfium2' or 'pypdf' to enable local PDF text extraction.)"
+        reader = PdfReader(io.BytesIO(pdf_bytes))
+        contents = []
+        for page in reader.pages:
+            page_text = page.extract_text() or ""
+            contents.append(page_text.strip())
+        return "\n".join(contents)
+
+    @staticmethod
+    def _extract_text_pdfium(pdf_bytes: bytes) -> str:
+        pdf = pdfium.PdfDocument(pdf_bytes)
+        contents = []
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                try:
+                    contents.append(textpage.get_text_range().strip())
+                finally:
+                    textpage.close()
+                    page.close()
+        finally:
+            pdf.close()
+        return "\n".join(contents)
 
     @staticmethod
     def _segment_paragraphs(text: str) -> list[str]:
-        raw_lines = [line.strip() for line in text.splitlines()]
-        paragraphs: list[str] = []
-        buffer: list[str] = []
-        for line in raw_lines:
-            if not line:
-                if buffer:
-                    paragraphs.append(" ".join(buffer))
-                    buffer.clear()
-                continue
-            buffer.append(line)
-        if buffer:
-            paragraphs.append(" ".join(buffer))
-        return paragraphs or ["(The source PDF did not contain extractable text.)"]
-
-    def extract_mindmap(
-        self, document: CloudDocument, pdf_bytes: bytes, prompt: str | None = None
-    ) -> Mindmap:
-        """Produce a simple mindmap tree derived from extracted text."""
-
-        del prompt  # Simple client ignores prompt but keeps signature parity.
-        text = self._extract_text(pdf_bytes)
-        branches = [p for p in self._segment_paragraphs(text) if p]
-        if not branches:
-            branches = ["No extractable content found."]
-
-        children = [MindmapNode(text=branch) for branch in branches]
-        root = MindmapNode(text=document.name or "Mindmap", children=children)
-        return Mindmap(root=root)
-
-    def classify_document(
-        self, document: CloudDocument, pdf_bytes: bytes, prompt: str | None = None
-    ) -> str:
-        """Heuristically route documents; simple client defaults to markdown."""
-
-        name = (document.name or "").lower()
-        if any(tag in name for tag in ("#mm", "#mindmap", " mindmap", " mind map")):
-            return "mindmap"
-        text = self._extract_text(pdf_bytes).lower()
-        if "#mm" in text or "#mindmap" in text:
-            return "mindmap"
-        return "markdown"
+        # One C-level regex split plus str.split per block replaces the old
+        # per-line Python loop with its strip/buffer bookkeeping.
+        paragraphs = [
+            " ".join(block.split()) for block in _PARAGRAPH_SPLIT.split(text)
+        ]
+        paragraphs = [paragraph for paragraph in paragraphs if paragraph]
+        return paragraphs or ["(The source PDF did not contain extractable text.)"]
+
+    def extract_mindmap(
+        self, document: CloudDocument, pdf_bytes: bytes, prompt: str | None = None
+    ) -> Mindmap:
+        """Produce a simple mindmap tree derived from extracted text."""
+
+        del prompt  # Simple client ignores prompt but keeps signature parity.
+        text = self._extract_text(pdf_bytes)
+        branches = [p for p in self._segment_paragraphs(text) if p]
+        if not branches:
+            branches = ["No extractable content found."]
+
+        children = [MindmapNode(text=branch) for branch in branches]
+        root = MindmapNode(text=document.name or "Mindmap", children=children)
+        return Mindmap(root=root)
+
+    def classify_document(
+        self, document: CloudDocument, pdf_bytes: bytes, prompt: str | None = None
+    ) -> str:
+        """Heuristically route documents; simple client defaults to markdown."""
+
+        name = (document.name or "").lower()
+        if any(tag in name for tag in ("#mm", "#mindmap", " mindmap", " mind map")):
+            return "mindmap"
+        text = self._extract_text(pdf_bytes).lower()
+        if "#mm" in text or "#mindmap" in text:
+            return "mindmap"
+        return "markdown"
 
 
 __all__ = ["SimpleLLMClient"]
@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Iterable
 
+#: Minimum seconds between explicit stream flushes; bursts of records in
+#: between ride the file buffer instead of issuing one syscall per line.
+_FLUSH_INTERVAL = 0.25
+
 
 class DailyLogFileHandler(logging.Handler):
     """Write log records to a per-day file while pruning older logs."""
@@ -19,6 +25,9 @@ class DailyLogFileHandler(logging.Handler):
         self.keep_days = max(keep_days, 1)
         self._current_day: date | None = None
         self._stream = None
+        self._last_flush = 0.0
+        self._day_rollover_ts = 0.0
+        self._flush_timer: threading.Timer | None = None
 
     def emit(self, record: logging.LogRecord) -> None:  # pragma: no cover - thin wrapper
         try:
@@ -28,12 +37,50 @@ class DailyLogFileHandler(logging.Handler):
             if stream is None:
                 return
             stream.write(msg + self.terminator)
-            stream.flush()
+            now = time.monotonic()
+            # Warnings and errors hit the disk immediately; lower levels ride
+            # the buffer, with a one-shot timer bounding how long the tail of
+            # a burst can sit there once the process goes idle.
+            if (
+                record.levelno >= logging.WARNING
+                or now - self._last_flush >= _FLUSH_INTERVAL
+            ):
+                stream.flush()
+                self._last_flush = now
+            elif self._flush_timer is None:
+                timer = threading.Timer(_FLUSH_INTERVAL, self._flush_from_timer)
+                timer.daemon = True
+                self._flush_timer = timer
+                timer.start()
         except Exception:  # noqa: PIE786 - standard logging pattern
             self.handleError(record)
 
+    def _flush_from_timer(self) -> None:
+        with self.lock:
+            self._flush_timer = None
+            stream = self._stream
+            if stream is not None:
+                stream.flush()
+                self._last_flush = time.monotonic()
+
+    def _cancel_flush_timer(self) -> None:
+        timer = self._flush_timer
+        if timer is not None:
+            timer.cancel()
+            self._flush_timer = None
+
+    def flush(self) -> None:
+        with self.lock:
+            self._cancel_flush_timer()
+            stream = self._stream
+            if stream is not None:
+                stream.flush()
+                self._last_flush = time.monotonic()
+
     def close(self) -> None:  # pragma: no cover - trivial
         try:
+            with self.lock:
+                self._cancel_flush_timer()
             if self._stream:
                 self._stream.close()
         finally:
@@ -43,9 +90,15 @@ class DailyLogFileHandler(logging.Handler):
     # Internal helpers -------------------------------------------------
 
     def _ensure_stream(self) -> None:
+        # Comparing a float against the cached local-midnight boundary avoids
+        # allocating a datetime and date object for every record.
+        if self._stream is not None and time.time() < self._day_rollover_ts:
+            return
         today = datetime.now().date()
         if self._stream is None or self._current_day != today:
             self._open_stream(today)
+        else:
+            self._day_rollover_ts = self._next_midnight_ts(today)
 
     def _open_stream(self, for_day: date) -> None:
         self.log_dir.mkdir(parents=True, exist_ok=True)
@@ -53,6 +106,12 @@ class DailyLogFileHandler(logging.Handler):
         path = self.log_dir / f"{for_day.isoformat()}.log"
         self._stream = path.open("a", encoding="utf-8")
         self._current_day = for_day
+        self._day_rollover_ts = self._next_midnight_ts(for_day)
+
+    @staticmethod
+    def _next_midnight_ts(for_day: date) -> float:
+        next_day = for_day + timedelta(days=1)
+        return datetime(next_day.year, next_day.month, next_day.day).timestamp()
 
     def _purge_old_logs(self, today: date) -> None:
         cutoff = today - timedelta(days=self.keep_days - 1)
@@ -70,7 +129,8 @@ class DailyLogFileHandler(logging.Handler):
     def _iter_log_files(self) -> Iterable[Path]:
         if not self.log_dir.exists():
             return []
-        return sorted(self.log_dir.glob("*.log"))
+        # Purging is order-independent; no need to sort the directory scan.
+        return self.log_dir.glob("*.log")
 
 
 def configure_logging(verbose: bool, log_dir: Path | None = None) -> None:
@@ -2,15 +2,27 @@
 
 from __future__ import annotations
 
+import importlib.util
 import json
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 
+_ORJSON_AVAILABLE = importlib.util.find_spec("orjson") is not None
+if _ORJSON_AVAILABLE:  # pragma: no cover - depends on optional dependency
+    import orjson  # type: ignore
+else:  # pragma: no cover - fallback path executed when dependency missing
+    orjson = None  # type: ignore
+
+
 class MindmapValidationError(ValueError):
     """Raised when a mindmap payload is malformed."""
 
 
+#: Keys a node payload may carry; validated once per node during builds.
+_ALLOWED_NODE_KEYS = frozenset(("text", "children", "link", "color", "priority"))
+
+
 @dataclass(slots=True)
 class MindmapNode:
     """Single node within a mindmap tree."""
@@ -23,11 +35,33 @@ class MindmapNode:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MindmapNode":
+        """Build a node tree without recursing once per payload node.
+
+        An explicit stack keeps arbitrarily deep LLM-supplied JSON from
+        exhausting the Python call stack and skips the per-frame overhead of
+        the previous recursive builder. Children are pushed in reverse so
+        each parent's list fills in payload order.
+        """
+
+        root_children: List["MindmapNode"] = []
+        stack: List[tuple] = [(data, root_children)]
+        while stack:
+            node_data, parent_children = stack.pop()
+            node, children_data = cls._build_shallow(node_data)
+            parent_children.append(node)
+            for child_data in reversed(children_data):
+                stack.append((child_data, node.children))
+        return root_children[0]
+
+    @classmethod
+    def _build_shallow(cls, data: Dict[str, Any]) -> tuple["MindmapNode", list]:
+        """Validate one payload mapping and return the node plus raw children."""
+
         if not isinstance(data, dict):
             raise MindmapValidationError("Node payload must be a mapping")
 
-        unexpected = set(data.keys()) - {"text", "children", "link", "color", "priority"}
-        if unexpected:
+        if not _ALLOWED_NODE_KEYS.issuperset(data):
+            unexpected = set(data) - _ALLOWED_NODE_KEYS
             raise MindmapValidationError(
                 f"Unexpected keys in node payload: {', '.join(sorted(unexpected))}"
             )
@@ -42,8 +76,6 @@ class MindmapNode:
         if not isinstance(children_data, list):
             raise MindmapValidationError("'children' must be a list when provided")
 
-        children = [cls.from_dict(child) for child in children_data]
-
         link = data.get("link")
         if link is not None and not isinstance(link, str):
             raise MindmapValidationError("'link' must be a string when provided")
@@ -64,13 +96,13 @@ class MindmapNode:
                     "'priority' must be an integer or string-encoded integer"
                 )
 
-        return cls(
+        node = cls(
             text=text.strip(),
-            children=children,
             link=link.strip() if isinstance(link, str) else None,
             color=color.strip() if isinstance(color, str) else None,
             priority=priority,
         )
+        return node, children_data
 
 
 @dataclass(slots=True)
@@ -92,10 +124,13 @@ class Mindmap:
         return cls(root=root_node)
 
     @classmethod
-    def from_json(cls, raw_json: str) -> "Mindmap":
+    def from_json(cls, raw_json: str | bytes) -> "Mindmap":
         try:
-            parsed = json.loads(raw_json)
-        except json.JSONDecodeError as exc:
+            if orjson is not None:
+                parsed = orjson.loads(raw_json)
+            else:
+                parsed = json.loads(raw_json)
+        except ValueError as exc:  # JSONDecodeError from either decoder
             raise MindmapValidationError("Mindmap JSON could not be parsed") from exc
         return cls.from_mapping(parsed)
 
@@ -104,13 +139,38 @@ def serialize_to_freemind(mindmap: Mindmap) -> str:
     """Render a Mindmap into FreeMind XML."""
 
     lines = ['<?xml version="1.0" encoding="UTF-8"?>', '<map version="1.0.1">']
-    lines.append(_serialize_node(mindmap.root, indent=2))
+    _write_node_lines(mindmap.root, 2, lines.append)
     lines.append("</map>")
     return "\n".join(lines)
 
 
-def _serialize_node(node: MindmapNode, *, indent: int) -> str:
-    pad = " " * indent
+def _write_node_lines(root: MindmapNode, indent: int, write) -> None:
+    """Emit one XML line per node via ``write``, depth-first and iteratively.
+
+    An explicit stack of pending nodes (and queued closing tags) avoids one
+    Python frame per node and the per-level intermediate joins the old
+    recursive serializer paid on wide trees.
+    """
+
+    stack: list = [(root, indent)]
+    while stack:
+        item = stack.pop()
+        if type(item) is str:
+            write(item)
+            continue
+        node, level = item
+        pad = " " * level
+        attr_text = _node_attributes(node)
+        if not node.children:
+            write(f"{pad}<node {attr_text}/>")
+            continue
+        write(f"{pad}<node {attr_text}>")
+        stack.append(f"{pad}</node>")
+        for child in reversed(node.children):
+            stack.append((child, level + 2))
+
+
+def _node_attributes(node: MindmapNode) -> str:
     attributes = [("TEXT", node.text)]
     if node.link:
         attributes.append(("LINK", node.link))
@@ -118,27 +178,22 @@ def _serialize_node(node: MindmapNode, *, indent: int) -> str:
         attributes.append(("COLOR", node.color))
     if node.priority is not None:
         attributes.append(("PRIORITY", str(node.priority)))
+    return " ".join(f'{key}="{_escape(value)}"' for key, value in attributes)
 
-    attr_text = " ".join(f'{key}="{_escape(value)}"' for key, value in attributes)
-    if not node.children:
-        return f"{pad}<node {attr_text}/>"
 
-    children_xml = [
-        _serialize_node(child, indent=indent + 2) for child in node.children
-    ]
-    children_block = "\n".join(children_xml)
-    closing_pad = " " * indent
-    return f"{pad}<node {attr_text}>\n{children_block}\n{closing_pad}</node>"
+# One translation table instead of five chained replace passes per string.
+_XML_ESCAPES = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&apos;"}
+)
 
 
 def _escape(value: str) -> str:
-    return (
-        value.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&apos;")
-    )
+    return value.translate(_XML_ESCAPES)
 
 
-__all__ = ["Mindmap", "MindmapNode", "MindmapValidationError", "serialize_to_freemind"]
+__all__ = [
+    "Mindmap",
+    "MindmapNode",
+    "MindmapValidationError",
+    "serialize_to_freemind",
+]
@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-import os
+import io
 import re
-import tempfile
 from datetime import datetime as dt_module, timezone
 from pathlib import Path
 from typing import Optional
@@ -12,6 +11,9 @@ from typing import Optional
 from .connectors.base import CloudDocument
 from .mindmap import Mindmap, serialize_to_freemind
 
+# Compiled once at import; _sanitize_name runs for every uploaded mindmap.
+_SANITIZE_PATTERN = re.compile(r"[^A-Za-z0-9._-]+")
+
 
 class GoogleDriveMindmapOutputHandler:
     """Upload FreeMind mindmaps to a Google Drive folder."""
@@ -40,31 +42,28 @@ class GoogleDriveMindmapOutputHandler:
         document: CloudDocument,
         mindmap: Mindmap,
     ) -> Path | None:
-        xml_content = serialize_to_freemind(mindmap)
+        encoded = serialize_to_freemind(mindmap).encode("utf-8")
         basename = self._build_basename(document)
         filename = f"{basename}.mm"
 
-        tmp_path: Optional[Path] = None
         local_path: Optional[Path] = None
         try:
-            tmp_path = self._write_temp_file(xml_content)
-            self._upload_to_drive(filename, tmp_path)
+            self._upload_to_drive(filename, encoded)
         finally:
             if self._keep_local_copy and self._local_directory:
                 local_path = self._local_directory / filename
-                local_path.write_text(xml_content, encoding="utf-8")
-            if tmp_path and tmp_path.exists():
-                try:
-                    tmp_path.unlink()
-                except OSError:
-                    pass
+                local_path.write_bytes(encoded)
         return local_path
 
-    def _upload_to_drive(self, filename: str, tmp_path: Path) -> None:
-        from googleapiclient.http import MediaFileUpload  # type: ignore
+    def _upload_to_drive(self, filename: str, xml_content: bytes) -> None:
+        from googleapiclient.http import MediaIoBaseUpload  # type: ignore
 
-        media = MediaFileUpload(
-            str(tmp_path), mimetype="application/x-freemind", resumable=False
+        # Upload straight from memory; staging the XML in a temp file only
+        # so the client could read it back cost three syscalls per mindmap.
+        media = MediaIoBaseUpload(
+            io.BytesIO(xml_content),
+            mimetype="application/x-freemind",
+            resumable=False,
         )
         metadata = {
             "name": filename,
@@ -81,15 +80,9 @@ class GoogleDriveMindmapOutputHandler:
             .execute()
         )
 
-    @staticmethod
-    def _write_temp_file(contents: str) -> Path:
-        with tempfile.NamedTemporaryFile(suffix=".mm", delete=False) as handle:
-            handle.write(contents.encode("utf-8"))
-            return Path(handle.name)
-
     @staticmethod
     def _sanitize_name(name: str) -> str:
-        safe = re.sub(r"[^A-Za-z0-9._-]+", "-", name).strip("-")
+        safe = _SANITIZE_PATTERN.sub("-", name).strip("-")
         return safe or "mindmap"
 
     def _build_basename(self, document: CloudDocument) -> str:
@@ -103,7 +96,13 @@ class GoogleDriveMindmapOutputHandler:
             timestamp = document.modified_at.astimezone(timezone.utc)
         else:
             timestamp = dt_module.now(timezone.utc)
-        return timestamp.strftime("%Y%m%d%H%M%S")
+        # f-string equivalent of strftime("%Y%m%d%H%M%S") without re-parsing
+        # the format string on every document.
+        t = timestamp
+        return (
+            f"{t.year:04d}{t.month:02d}{t.day:02d}"
+            f"{t.hour:02d}{t.minute:02d}{t.second:02d}"
+        )
 
 
 __all__ = ["GoogleDriveMindmapOutputHandler"]
@@ -5,13 +5,16 @@ from __future__ import annotations
 import logging
 import os
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Tuple
 from urllib.parse import parse_qs, urlparse
 
 from .config import AppConfig
-from .connectors.base import CloudConnector
+from .connectors.base import CloudConnector, CloudDocument
 from .connectors.google_drive import GoogleDriveConnector
 from .connectors.local import LocalFolderConnector
 from .llm.base import LLMClient
@@ -28,6 +31,71 @@ from .mindmap import Mindmap
 
 LOGGER = logging.getLogger("ink2md")
 
+#: Number of concurrent PDF downloads kept in flight per polling cycle.
+DEFAULT_DOWNLOAD_WORKERS = 4
+
+#: Idle polling backs off exponentially up to this multiple of the
+#: configured interval, resetting as soon as a document is processed.
+MAX_IDLE_BACKOFF_MULTIPLIER = 8
+
+
+def _next_poll_delay(current: float, base: float, processed: int) -> float:
+    """Return the next sleep interval for a continuous processing loop."""
+
+    if processed:
+        return base
+    return min(current * 2, base * MAX_IDLE_BACKOFF_MULTIPLIER)
+
+
+def _iter_pending(connector: CloudConnector, state: "ProcessingState") -> Iterator[CloudDocument]:
+    """Yield documents from the connector that have not been processed yet."""
+
+    # One snapshot instead of a lock acquisition per listed document; new
+    # completions land in the next poll anyway.
+    seen = state.processed_ids()
+    for document in connector.list_pdfs():
+        if document.identifier in seen:
+            LOGGER.debug("Skipping %s; already processed", document.identifier)
+            continue
+        yield document
+
+
+def _iter_concurrent(items, fn, *, max_workers: int):
+    """Map ``fn`` over ``items`` with a bounded thread pool, preserving order.
+
+    At most ``max_workers`` calls are in flight at a time, so neither the
+    source iterable nor the results are ever fully materialized.
+    """
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        in_flight: deque = deque()
+        for item in items:
+            in_flight.append(executor.submit(fn, item))
+            if len(in_flight) >= max_workers:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+def _iter_with_downloads(
+    connector: CloudConnector,
+    documents: Iterable[CloudDocument],
+    *,
+    max_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+) -> Iterator[Tuple[CloudDocument, bytes]]:
+    """Yield ``(document, pdf_bytes)`` pairs with downloads prefetched.
+
+    Downloads are network-bound, so a small thread pool keeps up to
+    ``max_workers`` transfers in flight while the caller converts the
+    current document. Results are yielded in listing order.
+    """
+
+    return _iter_concurrent(
+        documents,
+        lambda document: (document, connector.download_pdf(document)),
+        max_workers=max_workers,
+    )
+
 
 def _extract_code_from_user_input(raw_value: str) -> str:
     """Return the OAuth authorization code from direct input or a pasted URL."""
@@ -98,16 +166,25 @@ class PDFProcessor:
     llm_client: LLMClient
     output_handler: MarkdownOutputHandler
     prompt: Optional[str] = None
+    download_workers: int = DEFAULT_DOWNLOAD_WORKERS
 
     def run_once(self) -> int:
         processed = 0
-        for document in self.connector.list_pdfs():
-            if self.state.has_processed(document.identifier):
-                LOGGER.debug("Skipping %s; already processed", document.identifier)
-                continue
+        pending = _iter_pending(self.connector, self.state)
+
+        def _prepare(document: CloudDocument) -> Tuple[CloudDocument, bytes, str]:
             LOGGER.info("Processing %s", document.name)
             pdf_bytes = self.connector.download_pdf(document)
-            markdown = self.llm_client.convert_pdf(document, pdf_bytes, prompt=self.prompt)
+            markdown = self.llm_client.convert_pdf(
+                document, pdf_bytes, prompt=self.prompt
+            )
+            return document, pdf_bytes, markdown
+
+        # Download and convert concurrently; writes and state updates stay on
+        # this thread because the git-backed output handlers share one index.
+        for document, pdf_bytes, markdown in _iter_concurrent(
+            pending, _prepare, max_workers=self.download_workers
+        ):
             output_path = self.output_handler.write(
                 document, markdown, pdf_bytes=pdf_bytes
             )
@@ -118,10 +195,12 @@ class PDFProcessor:
 
     def run_forever(self, poll_interval: float) -> None:
         LOGGER.info("Starting continuous processing loop (interval=%s)", poll_interval)
+        delay = poll_interval
         while True:
             processed = self.run_once()
             LOGGER.info("Iteration complete; processed %s new documents", processed)
-            time.sleep(poll_interval)
+            delay = _next_poll_delay(delay, poll_interval, processed)
+            time.sleep(delay)
 
 
 @dataclass(slots=True)
@@ -133,15 +212,15 @@ class MindmapProcessor:
     llm_client: LLMClient
     output_handler: GoogleDriveMindmapOutputHandler
     prompt: Optional[str] = None
+    download_workers: int = DEFAULT_DOWNLOAD_WORKERS
 
     def run_once(self) -> int:
         processed = 0
-        for document in self.connector.list_pdfs():
-            if self.state.has_processed(document.identifier):
-                LOGGER.debug("Skipping %s; already processed", document.identifier)
-                continue
+        pending = _iter_pending(self.connector, self.state)
+        for document, pdf_bytes in _iter_with_downloads(
+            self.connector, pending, max_workers=self.download_workers
+        ):
             LOGGER.info("Processing mindmap %s", document.name)
-            pdf_bytes = self.connector.download_pdf(document)
             mindmap = self.llm_client.extract_mindmap(
                 document, pdf_bytes, prompt=self.prompt
             )
@@ -152,10 +231,12 @@ class MindmapProcessor:
 
     def run_forever(self, poll_interval: float) -> None:
         LOGGER.info("Starting continuous mindmap processing loop (interval=%s)", poll_interval)
+        delay = poll_interval
         while True:
             processed = self.run_once()
             LOGGER.info("Iteration complete; processed %s new mindmaps", processed)
-            time.sleep(poll_interval)
+            delay = _next_poll_delay(delay, poll_interval, processed)
+            time.sleep(delay)
 
 
 @dataclass(slots=True)
@@ -171,15 +252,14 @@ class AgenticProcessor:
     orchestration_prompt: Optional[str] = None
     markdown_prompt: Optional[str] = None
     mindmap_prompt: Optional[str] = None
+    download_workers: int = DEFAULT_DOWNLOAD_WORKERS
 
     def run_once(self) -> int:
         processed = 0
-        for document in self.connector.list_pdfs():
-            if self.state.has_processed(document.identifier):
-                LOGGER.debug("Skipping %s; already processed", document.identifier)
-                continue
-
-            pdf_bytes = self.connector.download_pdf(document)
+        pending = _iter_pending(self.connector, self.state)
+        for document, pdf_bytes in _iter_with_downloads(
+            self.connector, pending, max_workers=self.download_workers
+        ):
             target_pipeline = self._select_pipeline(document, pdf_bytes)
             if target_pipeline == "mindmap":
                 LOGGER.info("Routing %s to mindmap agent", document.name)
@@ -200,10 +280,12 @@ class AgenticProcessor:
 
     def run_forever(self, poll_interval: float) -> None:
         LOGGER.info("Starting agentic processing loop (interval=%s)", poll_interval)
+        delay = poll_interval
         while True:
             processed = self.run_once()
             LOGGER.info("Iteration complete; processed %s new documents", processed)
-            time.sleep(poll_interval)
+            delay = _next_poll_delay(delay, poll_interval, processed)
+            time.sleep(delay)
 
     def _select_pipeline(self, document: CloudDocument, pdf_bytes: bytes) -> str:
         if _has_mindmap_hashtag(document.name, self.hashtags):
@@ -348,11 +430,19 @@ def build_llm_client(config: AppConfig) -> LLMClient:
 
         from .llm.gemini import GeminiLLMClient
 
+        gemini_kwargs: dict = {}
+        if config.agentic and config.agentic.hashtags:
+            # Let the client short-circuit classification on the same
+            # hashtags the agentic router uses.
+            gemini_kwargs["classification_hashtags"] = config.agentic.hashtags
         return GeminiLLMClient(
             api_key=config.llm.api_key,
             model=config.llm.model,
             prompt=prompt_content,
             temperature=config.llm.temperature,
+            prefer_inline_payloads=config.llm.prefer_inline_payloads,
+            reuse_uploads=config.llm.reuse_uploads,
+            **gemini_kwargs,
         )
     raise ValueError(f"Unsupported LLM provider: {config.llm.provider}")
 
@@ -521,12 +611,21 @@ def _build_mindmap_processor(
     )
 
 
-def _load_prompt(path: Optional[Path]) -> Optional[str]:
-    if path and path.exists():
+@lru_cache(maxsize=16)
+def _read_prompt(path: Path) -> Optional[str]:
+    if path.exists():
         return path.read_text(encoding="utf-8")
     return None
 
 
+def _load_prompt(path: Optional[Path]) -> Optional[str]:
+    # The builders resolve the same fallback prompt several times per
+    # processor; caching keeps that to one disk read per distinct path.
+    if path is None:
+        return None
+    return _read_prompt(path)
+
+
 def _build_agentic_processor(
     config: AppConfig,
     *,
@@ -560,15 +659,14 @@ def _build_agentic_processor(
         local_directory=local_copy_dir,
     )
 
-    orchestration_prompt = _load_prompt(
-        (config.agentic and config.agentic.prompt_path) or None
-    ) or _load_prompt(config.llm.prompt_path)
-    markdown_prompt = _load_prompt(config.markdown.prompt_path) or _load_prompt(
-        config.llm.prompt_path
-    )
-    mindmap_prompt = _load_prompt(config.mindmap.prompt_path) or _load_prompt(
-        config.llm.prompt_path
+    # All three pipelines fall back to the shared LLM prompt; resolve it once.
+    fallback_prompt = _load_prompt(config.llm.prompt_path)
+    orchestration_prompt = (
+        _load_prompt((config.agentic and config.agentic.prompt_path) or None)
+        or fallback_prompt
     )
+    markdown_prompt = _load_prompt(config.markdown.prompt_path) or fallback_prompt
+    mindmap_prompt = _load_prompt(config.mindmap.prompt_path) or fallback_prompt
 
     hashtags = ("mm", "mindmap")
     if config.agentic and config.agentic.hashtags:
@@ -1,52 +1,142 @@
-"""Processing state tracking utilities."""
-
-from __future__ import annotations
-
-import json
-import threading
-from dataclasses import dataclass, field
+"""Processing state tracking utilities."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from pathlib import Path
-from typing import Dict
-
-
-@dataclass(slots=True)
-class ProcessingState:
-    """Persist IDs of documents that have already been processed."""
-
-    path: Path
-    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
-
-    def __post_init__(self) -> None:
-        self.path = self.path.expanduser().resolve()
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        if not self.path.exists():
-            self._write_state({"processed": {}})
-
-    def _read_state(self) -> Dict[str, Dict[str, str]]:
-        with self.path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
-
+from pathlib import Path
+from typing import Dict
+
+
+_UTC = timezone.utc
+
+_ORJSON_AVAILABLE = importlib.util.find_spec("orjson") is not None
+if _ORJSON_AVAILABLE:  # pragma: no cover - depends on optional dependency
+    import orjson  # type: ignore
+else:  # pragma: no cover - fallback path executed when dependency missing
+    orjson = None  # type: ignore
+
+#: Number of journal appends tolerated before folding them back into the
+#: JSON snapshot.
+COMPACT_EVERY = 64
+
+
+@dataclass(slots=True)
+class ProcessingState:
+    """Persist IDs of documents that have already been processed.
+
+    The JSON file at ``path`` remains the canonical snapshot, but instead of
+    rewriting it for every document, new entries are appended to a sidecar
+    journal (``<path>.log``, one JSON object per line) and folded back into
+    the snapshot every :data:`COMPACT_EVERY` appends. Lookups are served from
+    an in-memory mapping loaded once at start-up.
+    """
+
+    path: Path
+    _lock: threading.RLock = field(default_factory=threading.RLock, init=False, repr=False)
+    _processed: Dict[str, Dict[str, str]] = field(default_factory=dict, init=False, repr=False)
+    _journal_path: Path = field(init=False, repr=False)
+    _appends_since_compact: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.path = self.path.expanduser().resolve()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._journal_path = self.path.with_suffix(".log")
+        if self.path.exists():
+            self._processed = self._read_state().get("processed", {})
+        else:
+            self._write_state({"processed": {}})
+        if self._journal_path.exists():
+            self._replay_journal()
+
+    def _read_state(self) -> Dict[str, Dict[str, str]]:
+        raw = self.path.read_bytes()
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
+
     def _write_state(self, state: Dict[str, Dict[str, str]]) -> None:
         tmp_path = self.path.with_suffix(".tmp")
-        with tmp_path.open("w", encoding="utf-8") as handle:
-            json.dump(state, handle, indent=2, sort_keys=True)
+        # Compact output on purpose: the snapshot is machine-read, indentation
+        # forces json's slow pretty-printer path, and key order is already
+        # stable thanks to dict insertion order.
+        if orjson is not None:
+            raw = orjson.dumps(state)
+        else:
+            raw = json.dumps(state, separators=(",", ":")).encode("utf-8")
+        tmp_path.write_bytes(raw)
         tmp_path.replace(self.path)
 
+    def _replay_journal(self) -> None:
+        """Fold journal entries left over from a previous run into memory."""
+
+        loads = json.loads if orjson is None else orjson.loads
+        decode_error = json.JSONDecodeError if orjson is None else orjson.JSONDecodeError
+        with self._journal_path.open("rb") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = loads(line)
+                except decode_error:
+                    # A torn final line from an interrupted append; skip it.
+                    continue
+                document_id = record.pop("id", None)
+                if document_id:
+                    self._processed[document_id] = record
+        self._compact()
+
+    def _compact(self) -> None:
+        self._write_state({"processed": self._processed})
+        self._journal_path.unlink(missing_ok=True)
+        self._appends_since_compact = 0
+
+    def _append_journal(self, document_id: str, entry: Dict[str, str]) -> None:
+        record = {"id": document_id, **entry}
+        if orjson is not None:
+            line = orjson.dumps(record) + b"\n"
+        else:
+            line = json.dumps(record).encode("utf-8") + b"\n"
+        with self._journal_path.open("ab") as handle:
+            handle.write(line)
+
     def has_processed(self, document_id: str) -> bool:
         with self._lock:
-            state = self._read_state()
-            return document_id in state.get("processed", {})
-
-    def mark_processed(self, document_id: str, *, name: str | None = None) -> None:
-        with self._lock:
-            state = self._read_state()
-            processed = state.setdefault("processed", {})
-            processed[document_id] = {
-                "name": name or document_id,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            }
-            self._write_state(state)
-
-
-__all__ = ["ProcessingState"]
+            return document_id in self._processed
+
+    def processed_ids(self) -> frozenset[str]:
+        """Return a point-in-time snapshot of all processed document IDs.
+
+        Callers filtering a large listing can take the lock once here rather
+        than once per :meth:`has_processed` membership check.
+        """
+
+        with self._lock:
+            return frozenset(self._processed)
+
+    def mark_processed(self, document_id: str, *, name: str | None = None) -> None:
+        entry = {
+            "name": name or document_id,
+            "timestamp": datetime.now(_UTC).isoformat(),
+        }
+        with self._lock:
+            self._processed[document_id] = entry
+            self._appends_since_compact += 1
+            if self._appends_since_compact < COMPACT_EVERY:
+                self._append_journal(document_id, entry)
+                return
+            self._appends_since_compact = 0
+            # Snapshot first (atomic tmp+replace), truncate after, all under
+            # the lock: a crash between the two steps leaves a journal whose
+            # entries replay harmlessly onto the new snapshot, whereas the
+            # reverse order has a window where neither file covers the last
+            # COMPACT_EVERY documents.
+            self._write_state({"processed": self._processed})
+            self._journal_path.write_bytes(b"")
+
+
+__all__ = ["ProcessingState"]
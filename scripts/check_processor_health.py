@@ -53,6 +53,23 @@ def load_latest_event(state_path: Path) -> Tuple[str, datetime] | None:
         payload: Dict[str, Any] = json.load(handle)
 
     processed = payload.get("processed", {})
+
+    # Recent entries may still live in the append-only journal beside the
+    # snapshot; merge them so freshness checks see the latest documents.
+    journal_path = state_path.with_suffix(".log")
+    if journal_path.exists():
+        with journal_path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                document_id = record.pop("id", None)
+                if document_id:
+                    processed[document_id] = record
     latest_event: Tuple[str, datetime] | None = None
     for document_id, metadata in processed.items():
         timestamp_raw = metadata.get("timestamp")
@@ -109,3 +109,13 @@ def test_git_output_handler_skips_empty_commits(tmp_path: Path) -> None:
     rev_count_after = _git_output("rev-list", "--count", "HEAD", cwd=repository)
 
     assert initial_rev_count == rev_count_after
+
+
+def test_porcelain_has_staged_entry() -> None:
+    from ink2md.output import _porcelain_has_staged_entry
+
+    assert _porcelain_has_staged_entry("A  docs/new.md\0")
+    assert _porcelain_has_staged_entry("M  docs/changed.md\0?? scratch.txt\0")
+    assert not _porcelain_has_staged_entry("")
+    assert not _porcelain_has_staged_entry("?? untracked.md\0")
+    assert not _porcelain_has_staged_entry(" M docs/unstaged.md\0")
@@ -103,9 +103,10 @@ def test_download_pdf_streams_content(monkeypatch: pytest.MonkeyPatch, fake_driv
     connector, files_resource = fake_drive_service
 
     class _FakeDownloader:
-        def __init__(self, buffer, request):
+        def __init__(self, buffer, request, chunksize=None):
             self._buffer = buffer
             self._request = request
+            self._chunksize = chunksize
             self._finished = False
 
         def next_chunk(self):
@@ -198,9 +199,10 @@ def test_download_pdf_retries_on_server_error(monkeypatch: pytest.MonkeyPatch) -
     class _FlakyDownloader:
         failures_remaining = 1
 
-        def __init__(self, buffer, request):
+        def __init__(self, buffer, request, chunksize=None):
             self._buffer = buffer
             self._request = request
+            self._chunksize = chunksize
 
         def next_chunk(self):
             if type(self).failures_remaining > 0:
@@ -220,3 +222,25 @@ def test_download_pdf_retries_on_server_error(monkeypatch: pytest.MonkeyPatch) -
     payload = connector.download_pdf(document)
 
     assert payload == b"PDF data"
+
+
+def test_parse_drive_timestamp_matches_fromisoformat() -> None:
+    from ink2md.connectors.google_drive import _parse_drive_timestamp
+
+    values = [
+        "2024-01-02T03:04:05Z",
+        "2024-01-02T03:04:05.1Z",
+        "2024-01-02T03:04:05.123Z",
+        "2024-12-31T23:59:59.999999Z",
+        "1999-02-28T00:00:00Z",
+    ]
+    for value in values:
+        expected = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        assert _parse_drive_timestamp(value) == expected
+
+
+def test_parse_drive_timestamp_falls_back_for_unexpected_shapes() -> None:
+    from ink2md.connectors.google_drive import _parse_drive_timestamp
+
+    offset_value = "2024-06-01T12:00:00+02:00"
+    assert _parse_drive_timestamp(offset_value) == datetime.fromisoformat(offset_value)
@@ -0,0 +1,81 @@
+"""Tests for the journal-backed processing state."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from ink2md.state import COMPACT_EVERY, ProcessingState
+
+
+def test_mark_processed_journals_without_rewriting_snapshot(tmp_path: Path) -> None:
+    state_path = tmp_path / "state.json"
+    state = ProcessingState(state_path)
+    state.mark_processed("doc-1", name="First")
+    state.mark_processed("doc-2")
+
+    journal = state_path.with_suffix(".log")
+    records = [json.loads(line) for line in journal.read_bytes().splitlines() if line]
+    assert [record["id"] for record in records] == ["doc-1", "doc-2"]
+    assert records[0]["name"] == "First"
+    # Between compactions the snapshot stays untouched; the journal carries
+    # the new entries.
+    assert json.loads(state_path.read_bytes()) == {"processed": {}}
+
+    assert state.has_processed("doc-1")
+    assert state.processed_ids() == frozenset({"doc-1", "doc-2"})
+
+
+def test_restart_replays_journal_into_snapshot(tmp_path: Path) -> None:
+    state_path = tmp_path / "state.json"
+    state = ProcessingState(state_path)
+    state.mark_processed("doc-1")
+    state.mark_processed("doc-2")
+
+    reloaded = ProcessingState(state_path)
+    assert reloaded.processed_ids() == frozenset({"doc-1", "doc-2"})
+    # Replay folds the journal back into the snapshot and removes it.
+    assert not state_path.with_suffix(".log").exists()
+    snapshot = json.loads(state_path.read_bytes())["processed"]
+    assert set(snapshot) == {"doc-1", "doc-2"}
+
+
+def test_replay_skips_torn_final_line(tmp_path: Path) -> None:
+    state_path = tmp_path / "state.json"
+    ProcessingState(state_path)
+    journal = state_path.with_suffix(".log")
+    journal.write_bytes(
+        b'{"id": "doc-1", "name": "First", "timestamp": "t"}\n'
+        b'{"id": "doc-2", "na'
+    )
+
+    state = ProcessingState(state_path)
+    assert state.has_processed("doc-1")
+    assert not state.has_processed("doc-2")
+
+
+def test_compaction_truncates_journal_after_snapshot(tmp_path: Path) -> None:
+    state_path = tmp_path / "state.json"
+    state = ProcessingState(state_path)
+    for index in range(COMPACT_EVERY):
+        state.mark_processed(f"doc-{index}")
+
+    journal = state_path.with_suffix(".log")
+    assert journal.read_bytes() == b""
+    snapshot = json.loads(state_path.read_bytes())["processed"]
+    assert len(snapshot) == COMPACT_EVERY
+
+
+def test_leftover_journal_replays_idempotently_onto_snapshot(tmp_path: Path) -> None:
+    # A crash between the compaction snapshot and the journal truncate leaves
+    # entries that are already in the snapshot; restart must tolerate them.
+    state_path = tmp_path / "state.json"
+    state = ProcessingState(state_path)
+    for index in range(COMPACT_EVERY):
+        state.mark_processed(f"doc-{index}")
+    journal = state_path.with_suffix(".log")
+    journal.write_bytes(b'{"id": "doc-0", "name": "doc-0", "timestamp": "t"}\n')
+
+    reloaded = ProcessingState(state_path)
+    assert len(reloaded.processed_ids()) == COMPACT_EVERY
+    assert reloaded.has_processed("doc-0")